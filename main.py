@@ -2,15 +2,25 @@
 
 import curses
 import random
+import os
+import select
+import signal
+import sys
 import time
-from copy import deepcopy
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import groupby
+from typing import NamedTuple
 
 # Game constants
 BOARD_WIDTH = 10
 BOARD_HEIGHT = 20
 HIDDEN_ROWS = 4  # extra rows at top for spawning
 FPS = 30
+MAX_KEYS_PER_FRAME = 16  # bounds the work a pasted flood of keys can cause
+EMPTY_ROW = "  " * BOARD_WIDTH
+EMPTY_CELLS = [(None, False)] * BOARD_WIDTH
+CONTROLS = "Controls: Arrows / A D, Z/X rotate, Space hard drop, P pause, Q quit"
 
 # Tetromino definitions (using 4x4 matrices). Each piece is a list of rotation states.
 # We'll store rotations as lists of (x, y) coordinates relative to a 4x4 grid origin (0,0) top-left.
@@ -61,6 +71,65 @@ TETROMINOES = {
     ],
 }
 
+
+class PieceShape(NamedTuple):
+    # one bitmask per occupied row (min_y..max_y), bit 0 = column min_x
+    row_masks: tuple
+    min_x: int
+    max_x: int
+    min_y: int
+    max_y: int
+    blocks: tuple
+    # (bx, lowest by) for each occupied column
+    col_bottoms: tuple
+
+
+def _piece_shape(state):
+    xs = [bx for bx, _ in state]
+    ys = [by for _, by in state]
+    min_x, max_x, min_y, max_y = min(xs), max(xs), min(ys), max(ys)
+    masks = [0] * (max_y - min_y + 1)
+    bottoms = {}
+    for bx, by in state:
+        masks[by - min_y] |= 1 << (bx - min_x)
+        bottoms[bx] = max(by, bottoms.get(bx, by))
+    return PieceShape(
+        tuple(masks),
+        min_x,
+        max_x,
+        min_y,
+        max_y,
+        tuple(state),
+        tuple(bottoms.items()),
+    )
+
+
+# Built once at import: row masks, bounding box and block offsets for every
+# (kind, rotation), so collision tests are a bbox check plus a shift-and-AND
+# per row. Masks are aligned to the bbox corner so shifts are never negative
+# once the bounds check has passed.
+PIECE_TABLE = {
+    kind: tuple(_piece_shape(state) for state in states)
+    for kind, states in TETROMINOES.items()
+}
+
+
+def _preview_rows(state, height):
+    cells = set(state)
+    return tuple(
+        "".join("[]" if (bx, by) in cells else "  " for bx in range(4))
+        for by in range(height)
+    )
+
+
+# Next-piece preview as ready-made row strings, all padded to the same
+# height so drawing one kind fully overwrites the previous one.
+PREVIEW_HEIGHT = max(by for states in TETROMINOES.values() for _, by in states[0]) + 1
+PREVIEW_ROWS = {
+    kind: _preview_rows(states[0], PREVIEW_HEIGHT)
+    for kind, states in TETROMINOES.items()
+}
+
 COLORS = {
     "I": 6,
     "J": 4,
@@ -78,10 +147,16 @@ class Piece:
     rotation: int
     x: int
     y: int
+    # resolved once per piece; kind and rotation never change after creation
+    shape: PieceShape = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.rotation %= 4
+        self.shape = PIECE_TABLE[self.kind][self.rotation]
 
     def blocks(self):
-        state = TETROMINOES[self.kind][self.rotation % 4]
-        return [(self.x + bx, self.y + by) for (bx, by) in state]
+        x, y = self.x, self.y
+        return [(x + bx, y + by) for (bx, by) in self.shape.blocks]
 
     def rotated(self, delta):
         return Piece(self.kind, (self.rotation + delta) % 4, self.x, self.y)
@@ -92,75 +167,176 @@ class Board:
         self.width = width
         self.height = height
         self.hidden = hidden
-        self.grid = [[None for _ in range(width)] for _ in range(height + hidden)]
-
-    def inside(self, x, y):
-        return 0 <= x < self.width and 0 <= y < (self.height + self.hidden)
-
-    def empty(self, x, y):
-        if not self.inside(x, y):
-            return False
-        return self.grid[y][x] is None
+        # one bitmask per row for collision, kinds kept alongside for rendering
+        self.rows = [0] * (height + hidden)
+        self.full_row = (1 << width) - 1
+        # topmost filled row per column (height + hidden when empty)
+        self.col_top = [height + hidden] * width
+        self.colors = [[None] * width for _ in range(height + hidden)]
 
     def valid(self, piece: Piece):
-        for x, y in piece.blocks():
-            if not self.inside(x, y) or not self.empty(x, y):
+        return self.valid_at(piece.shape, piece.x, piece.y)
+
+    def valid_at(self, shape: PieceShape, x, y):
+        # bounds and occupancy in one pass, with everything hoisted to locals;
+        # lets callers probe a position without building a Piece for it
+        left = x + shape.min_x
+        top = y + shape.min_y
+        if (
+            left < 0
+            or x + shape.max_x >= self.width
+            or top < 0
+            or y + shape.max_y >= self.height + self.hidden
+        ):
+            return False
+        rows = self.rows
+        for i, mask in enumerate(shape.row_masks):
+            if rows[top + i] & (mask << left):
                 return False
         return True
 
     def place(self, piece: Piece):
-        for x, y in piece.blocks():
-            if self.inside(x, y):
-                self.grid[y][x] = piece.kind
+        shape = piece.shape
+        left = piece.x + shape.min_x
+        top = piece.y + shape.min_y
+        height = self.height + self.hidden
+        rows = self.rows
+        if (
+            left < 0
+            or piece.x + shape.max_x >= self.width
+            or top < 0
+            or piece.y + shape.max_y >= height
+        ):
+            # partly off the board: clip cell by cell, dropping what's outside
+            cells = [
+                (x, y)
+                for x, y in piece.blocks()
+                if 0 <= x < self.width and 0 <= y < height
+            ]
+            for x, y in cells:
+                rows[y] |= 1 << x
+        else:
+            for i, mask in enumerate(shape.row_masks):
+                rows[top + i] |= mask << left
+            cells = piece.blocks()
+        col_top = self.col_top
+        for x, y in cells:
+            self.colors[y][x] = piece.kind
+            if y < col_top[x]:
+                col_top[x] = y
 
     def clear_lines(self):
-        lines_cleared = 0
-        new_grid = []
-        for row in self.grid:
-            if all(cell is not None for cell in row):
-                lines_cleared += 1
+        full = self.full_row
+        rows = self.rows
+        # most locks clear nothing; the membership test runs in C
+        if full not in rows:
+            return 0
+        # compact in place from the bottom up, then recycle the cleared rows'
+        # colour lists as the new empty rows at the top
+        colors = self.colors
+        cleared = []
+        write = len(rows) - 1
+        for read in range(write, -1, -1):
+            if rows[read] == full:
+                cleared.append(colors[read])
             else:
-                new_grid.append(row)
-        for _ in range(lines_cleared):
-            new_grid.insert(0, [None] * self.width)
-        self.grid = new_grid
-        return lines_cleared
+                rows[write] = rows[read]
+                colors[write] = colors[read]
+                write -= 1
+        for y, row in enumerate(cleared):
+            rows[y] = 0
+            row[:] = [None] * self.width
+            colors[y] = row
+        for x in range(self.width):
+            bit = 1 << x
+            self.col_top[x] = next(
+                (y for y, r in enumerate(rows) if r & bit), len(rows)
+            )
+        return len(cleared)
+
+    def drop_distance(self, piece: Piece):
+        # how many rows the piece can fall: the smallest gap between each of
+        # its columns' lowest block and the first filled cell below it. The
+        # piece must pass valid() first: columns are indexed directly, so an
+        # off-board x would silently wrap to another column
+        rows = self.rows
+        col_top = self.col_top
+        distance = len(rows)
+        for bx, by in piece.shape.col_bottoms:
+            x = piece.x + bx
+            y = piece.y + by
+            below = col_top[x]
+            if below <= y:
+                # the column's top is above this block (overhang), so scan
+                bit = 1 << x
+                below = y + 1
+                while below < len(rows) and not rows[below] & bit:
+                    below += 1
+            distance = min(distance, below - y - 1)
+        return distance
+
+    def lock(self, piece: Piece):
+        # one headless simulation step: place the piece and clear full rows,
+        # returning the number of lines cleared; invalid placements (off the
+        # board or overlapping) are rejected before the board is touched
+        if not self.valid(piece):
+            raise ValueError(f"invalid placement: {piece}")
+        self.place(piece)
+        return self.clear_lines()
 
     def game_over(self):
         # game over if any block in the hidden rows (y < hidden) is filled
-        for y in range(self.hidden):
-            if any(self.grid[y][x] is not None for x in range(self.width)):
-                return True
-        return False
+        return any(self.rows[: self.hidden])
 
 
 class TetrisGame:
-    def __init__(self, stdscr):
+    def __init__(self, stdscr, seed=None):
         self.stdscr = stdscr
         self.board = Board()
         self.score = 0
         self.level = 0
         self.lines = 0
-        self.bag = []
+        # per-game generator: no shared module state between games, and a
+        # fixed seed always deals the same piece sequence (reproducible runs)
+        self.rng = random.Random(seed)
+        self.bag_pieces = tuple(TETROMINOES)
+        self.bag = deque()
         self.next_piece = None
         self.current = None
         self.lock_delay = 0.5
         self.drop_interval = self.level_to_interval(self.level)
-        self.last_drop_time = time.time()
+        self.last_drop_time = time.monotonic()
         self.gameover = False
         self.paused = False
+        # set whenever something visible changes; run() only draws when set
+        self.dirty = True
+        # what is currently on screen, so draw() only repaints what changed
+        self.shadow = [None] * self.board.height
+        self.shown_next = None
+        self.shown_overlay = None
         self.init_curses()
+        self.update_layout()
         self.spawn_next()
 
     def init_curses(self):
         curses.curs_set(0)
         self.stdscr.nodelay(True)
         self.stdscr.keypad(True)
-        curses.start_color()
-        curses.use_default_colors()
-        # init color pairs 1..7
-        for i in range(1, 8):
-            curses.init_pair(i, i, -1)
+        # decide once whether colour works instead of catching errors per cell
+        self.use_color = curses.has_colors()
+        if self.use_color:
+            curses.start_color()
+            curses.use_default_colors()
+            # init color pairs 1..7
+            for i in range(1, 8):
+                curses.init_pair(i, i, -1)
+        self.cell_attr = {
+            kind: curses.color_pair(COLORS[kind]) if self.use_color else 0
+            for kind in TETROMINOES
+        }
+        self.cell_attr_bold = {
+            kind: attr | curses.A_BOLD for kind, attr in self.cell_attr.items()
+        }
 
     def level_to_interval(self, level):
         # simplified gravity table; decreases interval as level rises
@@ -169,14 +345,12 @@ class TetrisGame:
         return interval
 
     def refill_bag(self):
-        pieces = list(TETROMINOES.keys())
-        random.shuffle(pieces)
-        self.bag.extend(pieces)
+        self.bag.extend(self.rng.sample(self.bag_pieces, len(self.bag_pieces)))
 
     def next_from_bag(self):
         if not self.bag:
             self.refill_bag()
-        return self.bag.pop(0)
+        return self.bag.popleft()
 
     def spawn_next(self):
         if self.next_piece is None:
@@ -186,6 +360,7 @@ class TetrisGame:
         # spawn position: x roughly centered, y = 0 (account for block offsets)
         piece = Piece(kind, 0, x=(self.board.width // 2) - 2, y=0)
         self.current = piece
+        self.dirty = True
         # if spawn invalid -> immediate game over
         if not self.board.valid(self.current):
             self.gameover = True
@@ -196,32 +371,33 @@ class TetrisGame:
         new_piece = self.current.rotated(delta)
         # simple wall-kick: try offsets
         for dx in (0, -1, 1, -2, 2):
-            candidate = Piece(
-                new_piece.kind, new_piece.rotation, new_piece.x + dx, new_piece.y
-            )
-            if self.board.valid(candidate):
-                self.current = candidate
+            if self.board.valid_at(new_piece.shape, new_piece.x + dx, new_piece.y):
+                new_piece.x += dx
+                self.current = new_piece
+                self.dirty = True
                 return
 
     def move_current(self, dx, dy):
-        if self.current is None:
+        cur = self.current
+        if cur is None:
             return False
-        moved = Piece(
-            self.current.kind,
-            self.current.rotation,
-            self.current.x + dx,
-            self.current.y + dy,
-        )
-        if self.board.valid(moved):
-            self.current = moved
+        x = cur.x + dx
+        y = cur.y + dy
+        if self.board.valid_at(cur.shape, x, y):
+            # kind and rotation are unchanged, so move the piece in place
+            cur.x = x
+            cur.y = y
+            self.dirty = True
             return True
         return False
 
     def hard_drop(self):
         if self.current is None:
             return
-        while self.move_current(0, 1):
-            pass
+        distance = self.board.drop_distance(self.current)
+        if distance:
+            self.current.y += distance
+            self.dirty = True
         self.lock_piece()
 
     def soft_drop(self):
@@ -231,8 +407,8 @@ class TetrisGame:
         return moved
 
     def lock_piece(self):
-        self.board.place(self.current)
-        cleared = self.board.clear_lines()
+        cleared = self.board.lock(self.current)
+        self.dirty = True
         if cleared:
             # scoring: standard-ish
             if cleared == 1:
@@ -253,7 +429,7 @@ class TetrisGame:
         self.spawn_next()
 
     def tick(self):
-        now = time.time()
+        now = time.monotonic()
         if self.paused or self.gameover:
             self.last_drop_time = now
             return
@@ -266,12 +442,19 @@ class TetrisGame:
             self.last_drop_time = now
 
     def handle_input(self):
-        try:
-            key = self.stdscr.getch()
-        except Exception:
-            key = -1
-        if key == -1:
-            return
+        # drain every pending key, so held or fast keys don't lag a frame each
+        for _ in range(MAX_KEYS_PER_FRAME):
+            try:
+                key = self.stdscr.getch()
+            except Exception:
+                key = -1
+            if key == -1:
+                return
+            self.handle_key(key)
+            if self.gameover:
+                return
+
+    def handle_key(self, key):
         if key in (curses.KEY_LEFT, ord("a")):
             self.move_current(-1, 0)
         elif key in (curses.KEY_RIGHT, ord("d")):
@@ -286,122 +469,189 @@ class TetrisGame:
             self.hard_drop()
         elif key in (ord("p"), ord("P")):
             self.paused = not self.paused
+            self.dirty = True
         elif key in (ord("q"), ord("Q")):
             self.gameover = True
+        elif key == curses.KEY_RESIZE:
+            self.update_layout()
+            self.dirty = True
 
-    def draw(self):
-        self.stdscr.erase()
-        # calculate offsets
+    def invalidate(self):
+        self.shadow = [None] * self.board.height
+        self.shown_next = None
+
+    def update_layout(self):
+        # screen size, offsets and windows only change on resize
         sh, sw = self.stdscr.getmaxyx()
-        board_w = self.board.width * 2 + 2
-        board_h = self.board.height + 2
-        offset_x = max(2, (sw - board_w - 20) // 2)
-        offset_y = max(1, (sh - board_h) // 2)
-
-        # draw border
-        for y in range(self.board.height + 2):
-            self.stdscr.addstr(offset_y + y, offset_x, "|")
-            self.stdscr.addstr(offset_y + y, offset_x + board_w - 1, "|")
-        self.stdscr.addstr(
-            offset_y + self.board.height + 1, offset_x, "+" + "-" * (board_w - 2) + "+"
+        self.screen_shape = (sh, sw)
+        self.board_w = self.board.width * 2 + 2
+        self.board_h = self.board.height + 2
+        self.offset_x = max(2, (sw - self.board_w - 20) // 2)
+        self.offset_y = max(1, (sh - self.board_h) // 2)
+        # check once here that everything fits, so draw() never has to guard
+        # its addstr calls against writing off screen
+        self.too_small = (
+            self.offset_x + self.board_w + 20 >= sw
+            or self.offset_y + self.board_h + 2 > sh
         )
+        self.controls = CONTROLS[: sw - self.offset_x - 1]
+        # the board and the sidebar get their own windows, so curses only has
+        # to diff those regions; stdscr is left with the controls line
+        if not self.too_small:
+            side_x = self.offset_x + self.board_w + 2
+            self.board_win = curses.newwin(
+                self.board_h, self.board_w, self.offset_y, self.offset_x
+            )
+            self.side_win = curses.newwin(
+                self.board_h, sw - side_x, self.offset_y, side_x
+            )
+        # force a full repaint on the next draw
+        self.shown_overlay = None
 
-        # draw grid
+    def draw(self):
+        if self.too_small:
+            self.stdscr.erase()
+            sw = self.screen_shape[1]
+            self.stdscr.addstr(0, 0, "Terminal too small"[: max(0, sw - 1)])
+            self.stdscr.refresh()
+            return
+
+        board_w = self.board_w
+        board_h = self.board_h
+        board_win = self.board_win
+        side_win = self.side_win
+
+        # a resize or an overlay going away leaves stale text behind: clear the
+        # screen once and repaint everything, including the static parts
+        overlay = (self.paused, self.gameover)
+        if overlay != self.shown_overlay:
+            self.shown_overlay = overlay
+            self.invalidate()
+            self.stdscr.erase()
+            board_win.erase()
+            side_win.erase()
+
+            # draw border; insstr for the bottom edge since addstr fails when
+            # it writes the window's bottom-right corner
+            for y in range(board_h - 1):
+                board_win.addstr(y, 0, "|")
+                board_win.addstr(y, board_w - 1, "|")
+            board_win.insstr(board_h - 1, 0, "+" + "-" * (board_w - 2) + "+")
+            side_win.addstr(4, 0, "Next:")
+
+            # instructions
+            if self.gameover:
+                self.stdscr.addstr(
+                    self.offset_y + board_h + 1,
+                    self.offset_x,
+                    "Press Q to quit or Ctrl+C to exit.",
+                )
+            else:
+                self.stdscr.addstr(
+                    self.offset_y + board_h + 1, self.offset_x, self.controls
+                )
+            self.stdscr.noutrefresh()
+
+        # draw grid with the current piece overlaid, skipping rows that look
+        # the same as last frame: one addstr per changed row, then one chgat
+        # per run of equally coloured cells
+        active = set(self.current.blocks()) if self.current else ()
         for y in range(self.board.hidden, self.board.height + self.board.hidden):
-            for x in range(self.board.width):
-                cell = self.board.grid[y][x]
-                draw_y = offset_y + 1 + (y - self.board.hidden)
-                draw_x = offset_x + 1 + x * 2
-                if cell is None:
-                    self.stdscr.addstr(draw_y, draw_x, "  ")
-                else:
-                    color = COLORS.get(cell, 1)
-                    try:
-                        self.stdscr.addstr(
-                            draw_y, draw_x, "[]", curses.color_pair(color)
-                        )
-                    except curses.error:
-                        # fallback if terminal doesn't support colors
-                        self.stdscr.addstr(draw_y, draw_x, "[]")
-
-        # draw current piece
-        if self.current:
-            for x, y in self.current.blocks():
-                if y >= self.board.hidden:
-                    draw_y = offset_y + 1 + (y - self.board.hidden)
-                    draw_x = offset_x + 1 + x * 2
-                    color = COLORS.get(self.current.kind, 1)
-                    try:
-                        self.stdscr.addstr(
-                            draw_y,
-                            draw_x,
-                            "[]",
-                            curses.color_pair(color) | curses.A_BOLD,
-                        )
-                    except curses.error:
-                        self.stdscr.addstr(draw_y, draw_x, "[]")
+            row = self.board.colors[y]
+            cells = [
+                (self.current.kind, True) if (x, y) in active else (row[x], False)
+                for x in range(self.board.width)
+            ]
+            if cells == self.shadow[y - self.board.hidden]:
+                continue
+            self.shadow[y - self.board.hidden] = cells
+            draw_y = 1 + (y - self.board.hidden)
+            if cells == EMPTY_CELLS:
+                board_win.addstr(draw_y, 1, EMPTY_ROW)
+                continue
+            board_win.addstr(
+                draw_y, 1, "".join("  " if kind is None else "[]" for kind, _ in cells)
+            )
+            x = 0
+            for (kind, bold), run in groupby(cells):
+                run_len = len(list(run))
+                if kind is not None:
+                    attr = (self.cell_attr_bold if bold else self.cell_attr)[kind]
+                    if attr:
+                        board_win.chgat(draw_y, 1 + x * 2, run_len * 2, attr)
+                x += run_len
 
         # draw next piece preview
-        self.stdscr.addstr(offset_y, offset_x + board_w + 2, f"Score: {self.score}")
-        self.stdscr.addstr(offset_y + 1, offset_x + board_w + 2, f"Level: {self.level}")
-        self.stdscr.addstr(offset_y + 2, offset_x + board_w + 2, f"Lines: {self.lines}")
-        self.stdscr.addstr(offset_y + 4, offset_x + board_w + 2, "Next:")
-        if self.next_piece:
-            shape = TETROMINOES[self.next_piece][0]
-            for bx, by in shape:
-                # normalize preview coords to 0..3 and draw
-                py = offset_y + 6 + by
-                px = offset_x + board_w + 2 + bx * 2
-                try:
-                    self.stdscr.addstr(
-                        py, px, "[]", curses.color_pair(COLORS.get(self.next_piece, 1))
-                    )
-                except curses.error:
-                    self.stdscr.addstr(py, px, "[]")
-
-        # instructions
-        self.stdscr.addstr(
-            offset_y + board_h + 1,
-            offset_x,
-            "Controls: Arrows / A D, Z/X rotate, Space hard drop, P pause, Q quit",
-        )
+        side_win.addstr(0, 0, f"Score: {self.score}")
+        side_win.addstr(1, 0, f"Level: {self.level}")
+        side_win.addstr(2, 0, f"Lines: {self.lines}")
+        if self.next_piece and self.next_piece != self.shown_next:
+            self.shown_next = self.next_piece
+            attr = self.cell_attr[self.next_piece]
+            for dy, row in enumerate(PREVIEW_ROWS[self.next_piece]):
+                side_win.addstr(6 + dy, 0, row, attr)
 
         if self.paused:
-            self.stdscr.addstr(
-                offset_y + board_h // 2, offset_x + board_w // 2 - 5, "[ PAUSED ]"
-            )
+            board_win.addstr(board_h // 2, board_w // 2 - 5, "[ PAUSED ]")
         if self.gameover:
-            self.stdscr.addstr(
-                offset_y + board_h // 2, offset_x + board_w // 2 - 6, "== GAME OVER =="
-            )
-            self.stdscr.addstr(
-                offset_y + board_h // 2 + 1,
-                offset_x + board_w // 2 - 10,
-                "Press Q to quit or Ctrl+C to exit.",
-            )
-
-        self.stdscr.refresh()
+            board_win.addstr(board_h // 2, board_w // 2 - 6, "== GAME OVER ==")
+
+        board_win.noutrefresh()
+        side_win.noutrefresh()
+        curses.doupdate()
+
+    def watch_resize(self):
+        # curses only learns about a resize inside getch(), which run() no
+        # longer calls while idle; route SIGWINCH through a pipe so select()
+        # wakes up for it as well
+        self.resize_fd, resize_w = os.pipe()
+        os.set_blocking(self.resize_fd, False)
+        os.set_blocking(resize_w, False)
+        signal.signal(signal.SIGWINCH, lambda signum, frame: None)
+        signal.set_wakeup_fd(resize_w)
+
+    def wait(self, timeout):
+        # block until a key arrives, the terminal is resized or the timeout
+        # passes; returns True after a resize
+        fds = [sys.stdin.fileno(), self.resize_fd]
+        ready, _, _ = select.select(fds, [], [], timeout)
+        if self.resize_fd not in ready:
+            return False
+        os.read(self.resize_fd, 512)
+        cols, lines = os.get_terminal_size(sys.stdout.fileno())
+        curses.resizeterm(lines, cols)
+        self.update_layout()
+        self.dirty = True
+        return True
 
     def run(self):
-        last_time = time.time()
+        # sleep in select() until a key arrives, the terminal is resized or
+        # gravity is due instead of polling every frame; FPS only caps how
+        # often a burst of input redraws
+        self.watch_resize()
+        last_frame = time.monotonic()
         while not self.gameover:
-            now = time.time()
-            dt = now - last_time
-            # limit frame rate
-            if dt < 1.0 / FPS:
-                time.sleep(max(0, 1.0 / FPS - dt))
-            last_time = time.time()
-
+            timeout = self.last_drop_time + self.drop_interval - time.monotonic()
+            self.wait(max(0, timeout))
             self.handle_input()
             self.tick()
+            if not self.dirty:
+                continue
             self.draw()
+            self.dirty = False
+
+            spare = last_frame + 1.0 / FPS - time.monotonic()
+            if spare > 0:
+                time.sleep(spare)
+            last_frame = time.monotonic()
 
         self.draw()
         while True:
+            if self.wait(None):
+                self.draw()
             key = self.stdscr.getch()
             if key in (ord("q"), ord("Q")):
                 break
-            time.sleep(0.05)
 
 
 def main(stdscr):